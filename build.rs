@@ -0,0 +1,67 @@
+//! Generates the alphabet lookup tables from the JSON files in `mcbase64x32/utils`,
+//! so the extension carries them as static data instead of parsing JSON on import.
+
+use std::env;
+use std::fmt::Write;
+use std::fs;
+use std::path::Path;
+
+/// Must match `MAX_TOKEN_LEN` in `src/lib.rs`.
+const MAX_TOKEN_LEN: usize = 6;
+
+fn load_alphabet(manifest_dir: &str, name: &str) -> Vec<String> {
+    let path = Path::new(manifest_dir).join("mcbase64x32/utils").join(name);
+    println!("cargo:rerun-if-changed={}", path.display());
+
+    let json: serde_json::Value = serde_json::from_str(&fs::read_to_string(&path).unwrap()).unwrap();
+    json["encode"]
+        .as_array()
+        .expect("alphabet must have an encode list")
+        .iter()
+        .map(|token| token.as_str().expect("tokens must be strings").to_owned())
+        .collect()
+}
+
+fn write_tokens(out: &mut String, name: &str, tokens: &[String]) {
+    writeln!(out, "static {}: [Token; {}] = [", name, tokens.len()).unwrap();
+    for token in tokens {
+        assert!(token.len() <= MAX_TOKEN_LEN, "token {:?} is longer than {} bytes", token, MAX_TOKEN_LEN);
+        let mut bytes = [0u8; MAX_TOKEN_LEN];
+        bytes[..token.len()].copy_from_slice(token.as_bytes());
+        writeln!(out, "    Token {{ bytes: {:?}, len: {} }},", bytes, token.len()).unwrap();
+    }
+    out.push_str("];\n\n");
+}
+
+fn main() {
+    let manifest_dir = env::var("CARGO_MANIFEST_DIR").unwrap();
+    let pairs = load_alphabet(&manifest_dir, "baseList.json");
+    let thin = load_alphabet(&manifest_dir, "thinBase64.json");
+
+    assert_eq!(pairs.len(), 2048, "encode must contain exactly 2048 items");
+    assert_eq!(thin.len(), 64, "encode must contain exactly 64 items");
+
+    // Decoding relies on every pair being a thin character followed by one of the first 32
+    for (i, pair) in pairs.iter().enumerate() {
+        let expected = format!("{}{}", thin[i >> 5], thin[i & 31]);
+        assert_eq!(pair, &expected, "pair {} must be thin characters {} and {}", i, i >> 5, i & 31);
+    }
+
+    let code_points: Vec<u16> = thin
+        .iter()
+        .map(|character| {
+            let mut chars = character.chars();
+            let code_point = chars.next().expect("thin characters must not be empty") as u32;
+            assert!(chars.next().is_none(), "thin character {:?} must be a single code point", character);
+            u16::try_from(code_point).expect("thin characters must be in the Basic Multilingual Plane")
+        })
+        .collect();
+
+    let mut out = String::new();
+    write_tokens(&mut out, "ENCODE_TOKENS", &pairs);
+    write_tokens(&mut out, "B64_TOKENS", &thin);
+    writeln!(out, "const THIN_CODE_POINTS: [u16; 64] = {:?};", code_points).unwrap();
+
+    let out_dir = env::var("OUT_DIR").unwrap();
+    fs::write(Path::new(&out_dir).join("tables.rs"), out).unwrap();
+}
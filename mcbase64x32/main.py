@@ -1,17 +1,47 @@
 """mcbase64x32 implementation using Rust for high performance."""
 
-from .mcbase64x32 import encode_rust, decode_rust
+from collections.abc import Iterable
+
+from .mcbase64x32 import encode_rust, decode_rust, encode_many_rust, decode_many_rust
 
 MAX_BYTES_PER_PAGE = 694
 
-def encode(payload: bytes) -> str:
-    """Encodes into mcBase64x32 using Rust implementation."""
+# Payloads of at most one byte are answered from these tables, skipping the
+# call into Rust whose overhead dwarfs the work for such tiny inputs.
+_TINY_PAYLOADS = [b""] + [bytes((i,)) for i in range(256)]
+_TINY_ENCODE = dict(zip(_TINY_PAYLOADS, encode_many_rust(_TINY_PAYLOADS)))
+_TINY_DECODE = {encoded: payload for payload, encoded in _TINY_ENCODE.items()}
+
+def encode(payload: bytes | bytearray | memoryview) -> str:
+    """Encodes into mcBase64x32 using Rust implementation.
+
+    Any bytes-like object is accepted and read in place without copying.
+    """
+    if type(payload) is bytes and len(payload) <= 1:
+        return _TINY_ENCODE[payload]
     return encode_rust(payload)
 
 def decode(text_in_mcbase64x32: str) -> bytes:
     """Decodes from mcBase64x32 using Rust implementation."""
+    if type(text_in_mcbase64x32) is str and len(text_in_mcbase64x32) <= 2:
+        cached = _TINY_DECODE.get(text_in_mcbase64x32)
+        if cached is not None:
+            return cached
     return decode_rust(text_in_mcbase64x32)
 
+def encode_many(payloads: Iterable[bytes | bytearray | memoryview]) -> list[str]:
+    """Encodes every payload with a single call into the Rust implementation.
+
+    Equivalent to ``[encode(p) for p in payloads]`` but pays the Python to Rust
+    call overhead once, which dominates when encoding many small payloads such
+    as book pages.
+    """
+    return encode_many_rust(list(payloads))
+
+def decode_many(texts_in_mcbase64x32: Iterable[str]) -> list[bytes]:
+    """Decodes every string with a single call into the Rust implementation."""
+    return decode_many_rust(list(texts_in_mcbase64x32))
+
 def main():
     """Demo function showing basic usage."""
     message = "Hello World using mcbase64x32!"
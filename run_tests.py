@@ -55,7 +55,7 @@ def main():
         (["uv", "run", "pytest", "tests/test_basic_functionality.py", "-v"], "Basic functionality tests"),
         (["uv", "run", "pytest", "tests/test_roundtrip.py", "-v"], "Round-trip tests"),
         (["uv", "run", "pytest", "tests/test_error_handling.py", "-v"], "Error handling tests"),
-        (["uv", "run", "pytest", "tests/", "--cov=src/mcbase64x32", "--cov-report=term-missing"], "Tests with coverage"),
+        (["uv", "run", "pytest", "tests/", "--cov=mcbase64x32", "--cov-report=term-missing"], "Tests with coverage"),
         (["uv", "run", "pytest", "tests/test_roundtrip.py::TestRoundTrip::test_known_failure_case", "-v"], "Known failure case test"),
     ]
     
@@ -1,122 +1,458 @@
-use std::collections::HashMap;
-use serde::{Deserialize, Serialize};
-use lazy_static::lazy_static;
-use bitstream_io::{BitReader, BigEndian, BitRead, BitWriter, BitWrite};
+use std::borrow::Cow;
+use std::fmt;
+use std::thread;
 use pyo3::prelude::*;
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyValueError;
+use pyo3::pybacked::PyBackedStr;
+use pyo3::types::PyBytes;
 
-const BASE_JSON: &str = include_str!("../mcbase64x32/utils/baseList.json");
-const BASE64_JSON: &str = include_str!("../mcbase64x32/utils/thinBase64.json");
+/// Inputs shorter than this many bytes per thread are processed on the calling thread.
+const PARALLEL_MIN_BYTES: usize = 1 << 20;
 
+/// Longest UTF-8 encoding of an output token: two three-byte characters.
+const MAX_TOKEN_LEN: usize = 6;
 
-#[derive(Serialize, Deserialize, Debug)]
-struct BaseList {
-    encode: Vec<String>,
-    decode: HashMap<String, u16>
+/// Marks code points that are not part of the alphabet in `CHAR_INDEX`.
+const INVALID_CHAR: u8 = 0xFF;
+
+
+/// UTF-8 bytes of one output token, stored inline so encoding never chases a `String` pointer.
+#[derive(Clone, Copy, Debug)]
+struct Token {
+    bytes: [u8; MAX_TOKEN_LEN],
+    len: u8,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
-struct Base64List {
-    encode: Vec<String>,
-    decode: HashMap<String, u8>
+impl Token {
+    fn as_bytes(&self) -> &[u8] {
+        &self.bytes[..self.len as usize]
+    }
 }
 
-lazy_static! {
-    static ref MAIN_CONVERSOR: ([String; 2048], HashMap<String, u16>) = {
-        let base: BaseList = serde_json::from_str(BASE_JSON).unwrap();
+// `ENCODE_TOKENS`, `B64_TOKENS` and `THIN_CODE_POINTS`, generated by build.rs from
+// the JSON alphabets in mcbase64x32/utils
+include!(concat!(env!("OUT_DIR"), "/tables.rs"));
 
-        let arr: [String; 2048] = base.encode
-            .try_into()
-            .expect("encode must contain exactly 2048 items");
+/// Thin base64 index of every alphabet character, keyed by code point.
+///
+/// Each pair is a high character from the whole 64-entry alphabet followed by
+/// a low character from its first 32 entries, so one 64 KiB table resolves
+/// pairs and single trailing characters without hashing.
+static CHAR_INDEX: [u8; 0x10000] = build_char_index();
 
-        (arr, base.decode)
-    };
+const fn build_char_index() -> [u8; 0x10000] {
+    let mut table = [INVALID_CHAR; 0x10000];
+    let mut i = 0;
+    while i < THIN_CODE_POINTS.len() {
+        table[THIN_CODE_POINTS[i] as usize] = i as u8;
+        i += 1;
+    }
+    table
+}
 
-    static ref B64_CONVERSOR: ([String; 64], HashMap<String, u8>) = {
-        let base: Base64List = serde_json::from_str(BASE64_JSON).unwrap();
-        let arr: [String; 64] = base.encode
-            .try_into()
-            .expect("encode must contain exactly 64 items");
-        (arr, base.decode)
-    };
+fn encode_base(input: u16) -> &'static [u8] {
+    ENCODE_TOKENS[input as usize].as_bytes()
 }
 
-fn encode_base(input: u16) -> &'static str {
-    &MAIN_CONVERSOR.0[input as usize]
+fn decode_pair(high: char, low: char) -> Option<u16> {
+    let high = *CHAR_INDEX.get(high as usize)?;
+    let low = *CHAR_INDEX.get(low as usize)?;
+    if high == INVALID_CHAR || low >= 32 {
+        return None;
+    }
+    Some(((high as u16) << 5) | low as u16)
 }
 
-fn decode_base(input: String) -> u16 {
-    MAIN_CONVERSOR.1[&input]
+fn encode_b64(input: u8) -> &'static [u8] {
+    B64_TOKENS[input as usize].as_bytes()
 }
 
-fn encode_b64(input: u8) -> &'static str {
-    &B64_CONVERSOR.0[input as usize]
+fn decode_single(input: char) -> Option<u8> {
+    let index = *CHAR_INDEX.get(input as usize)?;
+    (index != INVALID_CHAR).then_some(index)
 }
 
-fn decode_b64(input: String) -> u8 {
-    B64_CONVERSOR.1[&input]
+/// Loads the big-endian `u32` starting at `byte`, zero-filling past the end of `input`.
+fn load_be_u32(input: &[u8], byte: usize) -> u32 {
+    match input.get(byte..byte + 4) {
+        Some(word) => u32::from_be_bytes(word.try_into().unwrap()),
+        None => {
+            let mut word = [0u8; 4];
+            let tail = &input[byte.min(input.len())..];
+            word[..tail.len()].copy_from_slice(tail);
+            u32::from_be_bytes(word)
+        }
+    }
 }
 
-#[pyfunction]
-fn encode_rust(input: Vec<u8>) -> String {
-    let mut output = String::new();
+/// Loads the 11-byte group starting at `byte` into the top 88 bits of a big-endian `u128`.
+fn load_group(input: &[u8], byte: usize) -> u128 {
+    let mut word = [0u8; 16];
+    word[..11].copy_from_slice(&input[byte..byte + 11]);
+    u128::from_be_bytes(word)
+}
+
+/// Extracts the 11-bit field that starts at bit `bit` of the big-endian bitstream.
+fn read_code(input: &[u8], bit: usize) -> u16 {
+    let word = load_be_u32(input, bit >> 3);
+    ((word >> (21 - (bit & 7))) & 0x7FF) as u16
+}
+
+/// Encodes the leading complete chunks of `input` 16 at a time, returning how many were written.
+///
+/// Each 128-bit lane holds one 11-byte group of eight chunks. A byte shuffle
+/// gathers the four big-endian bytes behind each chunk into a little-endian
+/// `u32`, and a per-lane variable shift plus mask extracts the 11-bit code.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn encode_chunks_avx2(input: &[u8], output: &mut Vec<u8>) -> usize {
+    use std::arch::x86_64::*;
 
-    let mut reader = BitReader::endian(&input[..], BigEndian);
+    // Chunk `j` of a group is read from the big-endian `u32` at byte `11 * j / 8`,
+    // which is byte 0, 1, 2, 4 for chunks 0-3 and byte 5, 6, 8, 9 for chunks 4-7
+    let gather_first = _mm256_setr_epi8(
+        3, 2, 1, 0, 4, 3, 2, 1, 5, 4, 3, 2, 7, 6, 5, 4,
+        3, 2, 1, 0, 4, 3, 2, 1, 5, 4, 3, 2, 7, 6, 5, 4,
+    );
+    let gather_second = _mm256_setr_epi8(
+        8, 7, 6, 5, 9, 8, 7, 6, 11, 10, 9, 8, 12, 11, 10, 9,
+        8, 7, 6, 5, 9, 8, 7, 6, 11, 10, 9, 8, 12, 11, 10, 9,
+    );
+    // Each word is then shifted right by `21 - (11 * j) % 8`, split the same way as the gathers
+    let shift_first = _mm256_setr_epi32(21, 18, 15, 20, 21, 18, 15, 20);
+    let shift_second = _mm256_setr_epi32(17, 14, 19, 16, 17, 14, 19, 16);
+    let mask = _mm256_set1_epi32(0x7FF);
+
+    let tokens = &ENCODE_TOKENS;
+    let mut codes = [0u16; 16];
+    let mut chunk = 0;
+    let mut byte = 0;
+
+    // Each iteration reads 27 bytes and consumes 22 of them
+    while byte + 27 <= input.len() {
+        let ptr = input.as_ptr().add(byte);
+        let low = _mm_loadu_si128(ptr as *const __m128i);
+        let high = _mm_loadu_si128(ptr.add(11) as *const __m128i);
+        let words = _mm256_set_m128i(high, low);
+
+        let first = _mm256_and_si256(
+            _mm256_srlv_epi32(_mm256_shuffle_epi8(words, gather_first), shift_first),
+            mask,
+        );
+        let second = _mm256_and_si256(
+            _mm256_srlv_epi32(_mm256_shuffle_epi8(words, gather_second), shift_second),
+            mask,
+        );
+
+        // Packing interleaves the lanes (0-3, 8-11) and (4-7, 12-15) back into order 0-15
+        _mm256_storeu_si256(codes.as_mut_ptr() as *mut __m256i, _mm256_packus_epi32(first, second));
+
+        for &code in &codes {
+            output.extend_from_slice(tokens[code as usize].as_bytes());
+        }
+
+        chunk += 16;
+        byte += 22;
+    }
+
+    chunk
+}
+
+fn encode_bytes(input: &[u8]) -> Vec<u8> {
     let total_bits = input.len() * 8;
     let complete_chunks = total_bits / 11;
 
-    // Read complete 11-bit chunks
-    for _ in 0..complete_chunks {
-        let val = reader.read::<11, u16>().unwrap();
-        output.push_str(encode_base(val));
+    let tokens = &ENCODE_TOKENS;
+    // Reserve for every chunk plus the tail so the output never reallocates
+    let mut output: Vec<u8> = Vec::with_capacity((complete_chunks + 1) * MAX_TOKEN_LEN);
+    let mut first_chunk = 0;
+
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was just checked at runtime
+        first_chunk = unsafe { encode_chunks_avx2(input, &mut output) };
+    }
+
+    // Whole 11-byte groups, loaded once and split into eight chunks by constant shifts
+    let mut chunk = first_chunk;
+    while chunk + 8 <= complete_chunks {
+        let group = load_group(input, chunk / 8 * 11);
+        for j in 0..8 {
+            let code = (group >> (117 - 11 * j)) & 0x7FF;
+            output.extend_from_slice(tokens[code as usize].as_bytes());
+        }
+        chunk += 8;
+    }
+
+    // Read the remaining complete 11-bit chunks
+    for i in chunk..complete_chunks {
+        output.extend_from_slice(tokens[read_code(input, i * 11) as usize].as_bytes());
     }
 
     // Handle remaining bits if any
     let bits_left = total_bits % 11;
 
-    if bits_left == 0{
-        return output;
+    if bits_left != 0 {
+        // The zero-filled load leaves the remaining bits left-aligned in the chunk
+        let end_data = read_code(input, complete_chunks * 11);
+
+        if bits_left<=6 {
+            output.extend_from_slice(encode_b64((end_data >> 5) as u8));
+        }
+        else {
+            output.extend_from_slice(encode_base(end_data));
+        }
     }
-    let extra_bits = reader.read_var::<u16>(bits_left as u32).unwrap();
 
-    if bits_left<=6 {
-        let end_data:u8 = (extra_bits as u8) << (6 - bits_left);
-        output.push_str(encode_b64(end_data));
+    output
+}
+
+/// Encodes `input` on `workers` threads, splitting it on 11-byte group boundaries.
+///
+/// Every 11 bytes are exactly eight chunks, so only the last piece can have a
+/// partial tail and the encoded pieces concatenate into the serial output.
+fn encode_parallel(input: &[u8], workers: usize) -> Vec<u8> {
+    let piece_len = input.len().div_ceil(workers).div_ceil(11).max(1) * 11;
+
+    let pieces: Vec<Vec<u8>> = thread::scope(|scope| {
+        let handles: Vec<_> = input
+            .chunks(piece_len)
+            .map(|piece| scope.spawn(move || encode_bytes(piece)))
+            .collect();
+        handles.into_iter().map(|handle| handle.join().unwrap()).collect()
+    });
+
+    pieces.concat()
+}
+
+/// Packs big-endian bit fields into a byte slice, dropping a trailing partial byte.
+struct BitPacker<'a> {
+    output: &'a mut [u8],
+    len: usize,
+    pending: u32,
+    pending_bits: u32,
+}
+
+impl<'a> BitPacker<'a> {
+    fn new(output: &'a mut [u8]) -> Self {
+        BitPacker { output, len: 0, pending: 0, pending_bits: 0 }
     }
-    else {
-        let end_data =extra_bits<< (11 - bits_left);
-        output.push_str(encode_base(end_data));
+
+    /// Appends the low `width` bits of `value`, which must be at most 24 bits wide.
+    fn push(&mut self, value: u32, width: u32) {
+        self.pending = (self.pending << width) | value;
+        self.pending_bits += width;
+        while self.pending_bits >= 8 {
+            self.pending_bits -= 8;
+            self.output[self.len] = (self.pending >> self.pending_bits) as u8;
+            self.len += 1;
+        }
     }
 
-    output
+    /// Appends eight 11-bit codes as 11 whole bytes; must be called while byte aligned.
+    fn push_group(&mut self, codes: &[u16; 8]) {
+        debug_assert_eq!(self.pending_bits, 0);
+        let packed = codes.iter().fold(0u128, |packed, &code| (packed << 11) | code as u128);
+        self.output[self.len..self.len + 11].copy_from_slice(&packed.to_be_bytes()[5..]);
+        self.len += 11;
+    }
+
+    fn finish(self) {
+        debug_assert_eq!(self.len, self.output.len());
+    }
 }
 
-#[pyfunction]
-fn decode_rust(input: &str) -> Vec<u8> {
-    let mut raw_decoded: Vec<u16> = vec![];
-    let inputs_chars: Vec<char> = input.chars().collect();
-    for i in (1..inputs_chars.len()).step_by(2) {
-        let chunk = inputs_chars[i-1..i+1].iter().collect::<String>();
-        let val = decode_base(chunk);
-        raw_decoded.push(val);
+/// First character of a decode input that is not part of the alphabet.
+#[derive(Debug)]
+struct DecodeError {
+    position: usize,
+    pair: bool,
+}
+
+impl fmt::Display for DecodeError {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        let what = if self.pair { "character pair" } else { "character" };
+        write!(f, "invalid mcBase64x32 {} at position {}", what, self.position)
     }
+}
+
+/// Counts the characters of UTF-8 text by its lead bytes, far cheaper than walking `chars()`.
+fn count_chars(bytes: &[u8]) -> usize {
+    bytes.iter().filter(|&&b| b & 0xC0 != 0x80).count()
+}
+
+/// Number of whole bytes that `chars` characters decode to.
+fn decoded_len(chars: usize) -> usize {
+    (chars / 2 * 11 + chars % 2 * 6) / 8
+}
+
+/// Decodes `input` into `output`, which must be exactly `decoded_len` bytes long.
+fn decode_into(input: &str, output: &mut [u8]) -> Result<(), DecodeError> {
+    let mut packer = BitPacker::new(output);
+    let mut chars = input.chars();
+    let mut group = [0u16; 8];
+    let mut filled = 0;
+    let mut position = 0;
+    let mut last_char = None;
 
-    let mut output: Vec<u8> = Vec::new();
-    let mut writer = BitWriter::endian(&mut output, BigEndian);
+    while let Some(high) = chars.next() {
+        let Some(low) = chars.next() else {
+            last_char = Some(high);
+            break;
+        };
+        group[filled] = decode_pair(high, low).ok_or(DecodeError { position, pair: true })?;
+        filled += 1;
+        position += 2;
 
-    for &numero in &raw_decoded {
-        writer.write_var(11, numero).unwrap();
+        if filled == group.len() {
+            packer.push_group(&group);
+            filled = 0;
+        }
     }
 
-    if inputs_chars.len() % 2 == 1 {
-        let last_val = decode_b64(inputs_chars[inputs_chars.len()-1].to_string());
-        writer.write_var(6, last_val).unwrap();
+    for &numero in &group[..filled] {
+        packer.push(numero as u32, 11);
     }
 
-    //let padding_bits = ((input.len()/2)*11)%8;
+    if let Some(last_char) = last_char {
+        let last_val = decode_single(last_char).ok_or(DecodeError { position, pair: false })?;
+        packer.push(last_val as u32, 6);
+    }
 
-    //println!("{:?}", output);
+    packer.finish();
+    Ok(())
+}
 
-    output
+/// Decodes `input` on `workers` threads, splitting it on 16-character boundaries.
+///
+/// Sixteen characters are eight pairs, which decode to exactly 11 bytes, so
+/// every piece but the last decodes into its own whole-byte span of `output`.
+fn decode_parallel(input: &str, output: &mut [u8], workers: usize) -> Result<(), DecodeError> {
+    let target_len = input.len().div_ceil(workers);
+    let mut pieces = Vec::with_capacity(workers);
+    let mut start = 0;
+    let mut start_position = 0;
+    let mut rest = output;
+
+    while pieces.len() + 1 < workers && start < input.len() {
+        let mut end = (start + target_len).min(input.len());
+        while !input.is_char_boundary(end) {
+            end += 1;
+        }
+        let mut chars = count_chars(&input.as_bytes()[start..end]);
+        for character in input[end..].chars().take((16 - chars % 16) % 16) {
+            end += character.len_utf8();
+            chars += 1;
+        }
+
+        let (piece_output, remaining) = rest.split_at_mut(decoded_len(chars));
+        pieces.push((start_position, &input[start..end], piece_output));
+        rest = remaining;
+        start = end;
+        start_position += chars;
+    }
+    pieces.push((start_position, &input[start..], rest));
+
+    let decoded: Vec<Result<(), DecodeError>> = thread::scope(|scope| {
+        let handles: Vec<_> = pieces
+            .into_iter()
+            .map(|(offset, piece, piece_output)| {
+                scope.spawn(move || {
+                    decode_into(piece, piece_output)
+                        .map_err(|err| DecodeError { position: err.position + offset, ..err })
+                })
+            })
+            .collect();
+        handles.into_iter().map(|handle| handle.join().unwrap()).collect()
+    });
+
+    decoded.into_iter().collect()
+}
+
+/// Number of threads to spread an input of `len` bytes over.
+fn worker_count(len: usize) -> usize {
+    let available = thread::available_parallelism().map_or(1, |n| n.get());
+    available.min(len / PARALLEL_MIN_BYTES).max(1)
+}
+
+/// Encodes `input`, spreading large inputs over several threads.
+fn encode_payload(input: &[u8]) -> String {
+    let output = match worker_count(input.len()) {
+        1 => encode_bytes(input),
+        workers => encode_parallel(input, workers),
+    };
+
+    // SAFETY: every token is copied whole from a `String`, so the output is valid UTF-8
+    unsafe { String::from_utf8_unchecked(output) }
+}
+
+/// Decodes `input` into `output`, spreading large inputs over several threads.
+fn decode_text_into(input: &str, output: &mut [u8]) -> Result<(), DecodeError> {
+    match worker_count(input.len()) {
+        1 => decode_into(input, output),
+        workers => decode_parallel(input, output, workers),
+    }
+}
+
+impl From<DecodeError> for PyErr {
+    fn from(err: DecodeError) -> PyErr {
+        PyValueError::new_err(err.to_string())
+    }
+}
+
+/// Borrows the contents of `buffer`, copying them only when it is not contiguous.
+fn buffer_bytes<'a>(py: Python<'_>, buffer: &'a PyBuffer<u8>) -> PyResult<Cow<'a, [u8]>> {
+    if buffer.len_bytes() == 0 {
+        return Ok(Cow::Borrowed(&[]));
+    }
+    if !buffer.is_c_contiguous() {
+        return Ok(Cow::Owned(buffer.to_vec(py)?));
+    }
+
+    // SAFETY: the buffer holds `len_bytes` contiguous u8 values and stays alive while
+    // `buffer` does; holding the GIL keeps Python code from resizing or writing to it
+    let bytes = unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes()) };
+    Ok(Cow::Borrowed(bytes))
+}
+
+/// Accepts any object exposing a byte buffer (`bytes`, `bytearray`, `memoryview`, ...)
+/// and reads it in place unless it is not contiguous.
+#[pyfunction]
+fn encode_rust(py: Python<'_>, input: PyBuffer<u8>) -> PyResult<String> {
+    Ok(encode_payload(&buffer_bytes(py, &input)?))
+}
+
+/// Decodes straight into the returned `bytes` object, so the output is written exactly once.
+#[pyfunction]
+fn decode_rust<'py>(py: Python<'py>, input: &str) -> PyResult<Bound<'py, PyBytes>> {
+    let len = decoded_len(count_chars(input.as_bytes()));
+    PyBytes::new_with(py, len, |output| Ok(decode_text_into(input, output)?))
+}
+
+/// Encodes a whole sequence of payloads in one call, avoiding per-payload call overhead.
+#[pyfunction]
+fn encode_many_rust(py: Python<'_>, inputs: Vec<PyBuffer<u8>>) -> PyResult<Vec<String>> {
+    inputs
+        .iter()
+        .map(|input| Ok(encode_payload(&buffer_bytes(py, input)?)))
+        .collect()
+}
+
+/// Decodes a whole sequence of strings in one call, avoiding per-string call overhead.
+#[pyfunction]
+fn decode_many_rust<'py>(py: Python<'py>, inputs: Vec<PyBackedStr>) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+    inputs
+        .iter()
+        .enumerate()
+        .map(|(i, input)| {
+            let len = decoded_len(count_chars(input.as_bytes()));
+            PyBytes::new_with(py, len, |output| {
+                decode_text_into(input, output)
+                    .map_err(|err| PyValueError::new_err(format!("item {}: {}", i, err)))
+            })
+        })
+        .collect()
 }
 
 /// A Python module for encoding and decoding using custom base64x32 algorithm
@@ -124,5 +460,97 @@ fn decode_rust(input: &str) -> Vec<u8> {
 fn mcbase64x32(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(encode_rust, m)?)?;
     m.add_function(wrap_pyfunction!(decode_rust, m)?)?;
+    m.add_function(wrap_pyfunction!(encode_many_rust, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_many_rust, m)?)?;
     Ok(())
-}
\ No newline at end of file
+}
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Deterministic xorshift bytes, so failures reproduce without a `rand` dependency.
+    fn sample_bytes(len: usize) -> Vec<u8> {
+        let mut state = 0x9E37_79B9_7F4A_7C15u64 ^ len as u64;
+        (0..len)
+            .map(|_| {
+                state ^= state << 13;
+                state ^= state >> 7;
+                state ^= state << 17;
+                (state >> 24) as u8
+            })
+            .collect()
+    }
+
+    fn encode_str(input: &[u8]) -> String {
+        String::from_utf8(encode_bytes(input)).unwrap()
+    }
+
+    fn decode_serial(input: &str) -> Result<Vec<u8>, DecodeError> {
+        let mut output = vec![0u8; decoded_len(count_chars(input.as_bytes()))];
+        decode_into(input, &mut output)?;
+        Ok(output)
+    }
+
+    fn decode_with_workers(input: &str, workers: usize) -> Result<Vec<u8>, DecodeError> {
+        let mut output = vec![0u8; decoded_len(count_chars(input.as_bytes()))];
+        decode_parallel(input, &mut output, workers)?;
+        Ok(output)
+    }
+
+    #[test]
+    fn parallel_encode_matches_serial() {
+        for len in 0..4000 {
+            let input = sample_bytes(len);
+            let serial = encode_bytes(&input);
+            for workers in 2..=5 {
+                assert_eq!(encode_parallel(&input, workers), serial, "len {} workers {}", len, workers);
+            }
+        }
+    }
+
+    #[test]
+    fn parallel_decode_matches_serial() {
+        for len in 0..4000 {
+            let input = sample_bytes(len);
+            let encoded = encode_str(&input);
+            assert_eq!(decode_serial(&encoded).unwrap(), input, "len {}", len);
+            for workers in 2..=5 {
+                assert_eq!(decode_with_workers(&encoded, workers).unwrap(), input, "len {} workers {}", len, workers);
+            }
+        }
+    }
+
+    #[test]
+    fn parallel_decode_reports_positions_in_whole_input() {
+        let encoded = encode_str(&sample_bytes(4000));
+        let mut chars: Vec<char> = encoded.chars().collect();
+        // An even position in the last quarter, well past the first piece for any worker count
+        let position = chars.len() * 7 / 8 & !1;
+        chars[position] = 'a';
+        chars[position + 1] = 'b';
+        let corrupted: String = chars.iter().collect();
+
+        let serial = decode_serial(&corrupted).unwrap_err();
+        assert_eq!((serial.position, serial.pair), (position, true));
+        for workers in 2..=5 {
+            let err = decode_with_workers(&corrupted, workers).unwrap_err();
+            assert_eq!((err.position, err.pair), (position, true), "workers {}", workers);
+        }
+    }
+
+    #[test]
+    fn parallel_decode_reports_invalid_trailing_character() {
+        // 4002 bytes encode to an odd number of characters, ending in a single thin character
+        let encoded = encode_str(&sample_bytes(4002));
+        let mut chars: Vec<char> = encoded.chars().collect();
+        assert_eq!(chars.len() % 2, 1);
+        let position = chars.len() - 1;
+        chars[position] = 'a';
+        let corrupted: String = chars.iter().collect();
+
+        for workers in 2..=5 {
+            let err = decode_with_workers(&corrupted, workers).unwrap_err();
+            assert_eq!((err.position, err.pair), (position, false), "workers {}", workers);
+        }
+    }
+}
@@ -1,8 +1,9 @@
 """Pytest configuration and fixtures for mcbase64x32 tests."""
 
+import os
 import pytest
 import random
-from typing import Generator
+from typing import Callable, Generator
 
 
 @pytest.fixture(scope="session")
@@ -63,17 +64,46 @@ def metadata_like_patterns() -> list[bytes]:
         b"\x00\x01\x02\x03\x80\x81\x82\x83",
         b"\xff\xfe\xfd\xfc\x7f\x7e\x7d\x7c",
         b"metadata\x00\x01\x02\x03\x04\x05",
-        b"\x15\xfa\xce\x70" + b"data" + b"\x00\x00\x01",
+        b"\x15\xfa\xce\x70data\x00\x00\x01",
     ]
 
 
+@pytest.fixture(scope="session")
+def random_pool() -> Callable[[int], bytes]:
+    """Provide random payloads sliced from one block that grows on demand.
+
+    The block is only extended when a test asks for more bytes than it
+    holds, so a run that selects only the small cases never reads the
+    multi-megabyte payloads from the kernel CSPRNG.
+    """
+    pool = b""
+
+    def take(size: int) -> bytes:
+        nonlocal pool
+        if size > len(pool):
+            pool += os.urandom(size - len(pool))
+        return pool[:size]
+
+    return take
+
+
+@pytest.fixture(scope="module")
+def random_blob(request: pytest.FixtureRequest, random_pool: Callable[[int], bytes]) -> bytes:
+    """Provide random bytes of the size given by indirect parametrization.
+
+    Module scope means tests in the same module that ask for the same size
+    share one buffer instead of each slicing a new copy out of the pool.
+    """
+    return random_pool(request.param)
+
+
 @pytest.fixture
 def random_payload_generator(random_seed: int) -> Generator[bytes, None, None]:
     """Generate random payloads for testing."""
-    random.seed(random_seed)
+    rng = random.Random(random_seed)
     
     def generate_payload(size: int) -> bytes:
-        return bytes([random.randint(0, 255) for _ in range(size)])
+        return rng.randbytes(size)
     
     return generate_payload # type: ignore
 
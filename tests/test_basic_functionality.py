@@ -6,6 +6,7 @@ to ensure the library works correctly for various input types.
 
 import pytest
 import mcbase64x32
+from mcbase64x32 import encode, decode
 
 
 class TestBasicFunctionality:
@@ -27,8 +28,8 @@ class TestBasicFunctionality:
         
         for text in test_strings:
                 payload = text.encode('utf-8')
-                encoded = mcbase64x32.encode(payload)
-                decoded = mcbase64x32.decode(encoded)
+                encoded = encode(payload)
+                decoded = decode(encoded)
                 decoded_text = decoded.decode('utf-8')
                 
                 assert text == decoded_text, (
@@ -52,8 +53,8 @@ class TestBasicFunctionality:
         ]
         
         for data in test_data:
-                encoded = mcbase64x32.encode(data)
-                decoded = mcbase64x32.decode(encoded)
+                encoded = encode(data)
+                decoded = decode(encoded)
                 
                 assert data == decoded, (
                     f"Binary data round-trip failed for {data.hex()}:\n"
@@ -71,14 +72,27 @@ class TestBasicFunctionality:
     def test_encode_function_signature(self):
         """Test that encode function accepts bytes and returns string."""
         payload = b"test"
-        result = mcbase64x32.encode(payload)
+        result = encode(payload)
         
         assert isinstance(result, str), f"encode() should return str, got {type(result)}"
 
+    def test_encode_accepts_bytes_like_objects(self):
+        """Test that encode accepts bytearray and memoryview like bytes."""
+        payload = b"bytes-like payload \x00\xff"
+        expected = encode(payload)
+        
+        assert encode(bytearray(payload)) == expected
+        assert encode(memoryview(payload)) == expected
+        assert encode(memoryview(b"xx" + payload)[2:]) == expected
+        
+        # Non-contiguous views are copied before encoding
+        source = bytes(range(64))
+        assert encode(memoryview(source)[::2]) == encode(source[::2])
+
     def test_decode_function_signature(self):
         """Test that decode function accepts string and returns bytes."""
-        encoded = mcbase64x32.encode(b"test")
-        result = mcbase64x32.decode(encoded)
+        encoded = encode(b"test")
+        result = decode(encoded)
         
         assert isinstance(result, bytes), f"decode() should return bytes, got {type(result)}"
 
@@ -86,34 +100,34 @@ class TestBasicFunctionality:
         """Test handling of empty inputs."""
         # Empty bytes
         empty_bytes = b""
-        encoded = mcbase64x32.encode(empty_bytes)
-        decoded = mcbase64x32.decode(encoded)
+        encoded = encode(empty_bytes)
+        decoded = decode(encoded)
         assert empty_bytes == decoded
 
     def test_single_character_encoding(self):
         """Test encoding of single characters."""
         for i in range(256):
             char = bytes([i])
-            encoded = mcbase64x32.encode(char)
-            decoded = mcbase64x32.decode(encoded)
+            encoded = encode(char)
+            decoded = decode(encoded)
             assert char == decoded, f"Single character {i:02x} encoding failed"
 
     def test_encoding_idempotency(self):
         """Test that encoding the same data multiple times produces the same result."""
         payload = b"test payload"
         
-        encoded1 = mcbase64x32.encode(payload)
-        encoded2 = mcbase64x32.encode(payload)
+        encoded1 = encode(payload)
+        encoded2 = encode(payload)
         
         assert encoded1 == encoded2, "Encoding should be idempotent"
 
     def test_decoding_idempotency(self):
         """Test that decoding the same encoded string multiple times produces the same result."""
         payload = b"test payload"
-        encoded = mcbase64x32.encode(payload)
+        encoded = encode(payload)
         
-        decoded1 = mcbase64x32.decode(encoded)
-        decoded2 = mcbase64x32.decode(encoded)
+        decoded1 = decode(encoded)
+        decoded2 = decode(encoded)
         
         assert decoded1 == decoded2, "Decoding should be idempotent"
 
@@ -124,8 +138,8 @@ class TestBasicFunctionality:
         # Multiple encode/decode cycles
         current = payload
         for i in range(5):
-            encoded = mcbase64x32.encode(current)
-            current = mcbase64x32.decode(encoded)
+            encoded = encode(current)
+            current = decode(encoded)
         
         assert payload == current, f"Multiple round-trips failed after 5 cycles"
 
@@ -135,7 +149,7 @@ class TestBasicFunctionality:
         
         lengths = []
         for _ in range(10):
-            encoded = mcbase64x32.encode(payload)
+            encoded = encode(payload)
             lengths.append(len(encoded))
         
         assert all(length == lengths[0] for length in lengths), "Encoding length should be consistent"
@@ -154,8 +168,8 @@ class TestBasicFunctionality:
         ]
         
         for sequence in test_sequences:
-                encoded = mcbase64x32.encode(sequence)
-                decoded = mcbase64x32.decode(encoded)
+                encoded = encode(sequence)
+                decoded = decode(encoded)
                 
                 assert sequence == decoded, (
                     f"High-bit sequence round-trip failed for {sequence.hex()}:\n"
@@ -163,3 +177,31 @@ class TestBasicFunctionality:
                     f"Decoded:  {decoded.hex()}\n"
                     f"Encoded:  {repr(encoded)}"
                 )
+
+    def test_page_sized_payloads(self):
+        """Test round-trip of payloads around the size of a full book page."""
+        for size in (mcbase64x32.MAX_BYTES_PER_PAGE - 1, mcbase64x32.MAX_BYTES_PER_PAGE, mcbase64x32.MAX_BYTES_PER_PAGE + 1):
+            payload = bytes(i * 7 % 256 for i in range(size))
+            
+            assert decode(encode(payload)) == payload
+            assert encode(bytearray(payload)) == encode(payload)
+
+    def test_encode_many_matches_encode(self):
+        """Test that batch encoding matches encoding each payload on its own."""
+        payloads = [b"", b"\x00", b"\xff", b"Hello, World!", bytes(range(256)), b"x" * mcbase64x32.MAX_BYTES_PER_PAGE]
+        
+        encoded = mcbase64x32.encode_many(payloads)
+        
+        assert encoded == [encode(payload) for payload in payloads]
+        assert mcbase64x32.decode_many(encoded) == payloads
+
+    def test_batch_functions_accept_iterables(self):
+        """Test that batch functions accept any iterable, including empty ones."""
+        payloads = [b"page one", bytearray(b"page two"), memoryview(b"page three")]
+        
+        encoded = mcbase64x32.encode_many(iter(payloads))
+        decoded = mcbase64x32.decode_many(text for text in encoded)
+        
+        assert decoded == [bytes(payload) for payload in payloads]
+        assert mcbase64x32.encode_many([]) == []
+        assert mcbase64x32.decode_many([]) == []
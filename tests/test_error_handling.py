@@ -6,6 +6,7 @@ behaves correctly when given invalid inputs.
 
 import pytest
 import mcbase64x32
+from mcbase64x32 import encode, decode
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -13,29 +14,29 @@ class TestErrorHandling:
     def test_invalid_decode_input_type(self):
         """Test that decode function handles invalid input types gracefully."""
         with pytest.raises((TypeError, AttributeError)):
-            mcbase64x32.decode(123)  # type: ignore # Should not accept integers
+            decode(123)  # type: ignore # Should not accept integers
         
         with pytest.raises((TypeError, AttributeError)):
-            mcbase64x32.decode(None)  # type: ignore # Should not accept None
+            decode(None)  # type: ignore # Should not accept None
         
         with pytest.raises((TypeError, AttributeError)):
-            mcbase64x32.decode(b"bytes")  # type: ignore # Should not accept bytes
+            decode(b"bytes")  # type: ignore # Should not accept bytes
 
     def test_invalid_encode_input_type(self):
         """Test that encode function handles invalid input types gracefully."""
         with pytest.raises((TypeError, AttributeError)):
-            mcbase64x32.encode("string")  # type: ignore # Should not accept strings directly
+            encode("string")  # type: ignore # Should not accept strings directly
         
         with pytest.raises((TypeError, AttributeError)):
-            mcbase64x32.encode(123)  # type: ignore # Should not accept integers
+            encode(123)  # type: ignore # Should not accept integers
         
         with pytest.raises((TypeError, AttributeError)):
-            mcbase64x32.encode(None)  # type: ignore # Should not accept None
+            encode(None)  # type: ignore # Should not accept None
 
     def test_decode_empty_string(self):
         """Test decoding of empty string."""
         # Empty string should decode to empty bytes
-        result = mcbase64x32.decode("")
+        result = decode("")
         assert result == b"", "Empty string should decode to empty bytes"
 
     def test_decode_odd_length_string(self):
@@ -43,7 +44,7 @@ class TestErrorHandling:
         # The decode function processes 2 characters at a time
         # An odd-length string should be handled gracefully
         try:
-            result = mcbase64x32.decode("a")  # Single character
+            result = decode("a")  # Single character
             # Should either work or raise a specific error
             assert isinstance(result, bytes)
         except:
@@ -62,21 +63,45 @@ class TestErrorHandling:
         
         for invalid_string in invalid_strings:
                 try:
-                    result = mcbase64x32.decode(invalid_string)
+                    result = decode(invalid_string)
                     # If it doesn't raise an error, the result should be bytes
                     assert isinstance(result, bytes)
                 except:
                     # These are acceptable errors for invalid input
                     pass
 
+    def test_decode_invalid_pair_raises_value_error(self):
+        """Test that pairs outside the alphabet raise ValueError."""
+        encoded = encode(b"test")
+        
+        with pytest.raises(ValueError):
+            decode("ab" + encoded)
+        
+        with pytest.raises(ValueError):
+            decode(encoded[:2] + "ab")
+
+    def test_decode_invalid_trailing_character_raises_value_error(self):
+        """Test that an odd trailing character outside the alphabet raises ValueError."""
+        encoded = encode(b"test")
+        
+        with pytest.raises(ValueError):
+            decode(encoded + "a")
+
+    def test_decode_many_invalid_item_raises_value_error(self):
+        """Test that batch decoding reports invalid input as ValueError."""
+        encoded = encode(b"test")
+        
+        with pytest.raises(ValueError, match="item 1"):
+            mcbase64x32.decode_many([encoded, "ab" + encoded])
+
     def test_large_payload_handling(self):
         """Test handling of large payloads."""
         # Test with payload larger than MAX_BYTES_PER_PAGE
         large_payload = b"x" * (mcbase64x32.MAX_BYTES_PER_PAGE + 100)
         
         try:
-            encoded = mcbase64x32.encode(large_payload)
-            decoded = mcbase64x32.decode(encoded)
+            encoded = encode(large_payload)
+            decoded = decode(encoded)
             
             # Should either work correctly or raise a specific error
             assert isinstance(encoded, str)
@@ -100,8 +125,8 @@ class TestErrorHandling:
         ]
         
         for payload in small_payloads:
-                encoded = mcbase64x32.encode(payload)
-                decoded = mcbase64x32.decode(encoded)
+                encoded = encode(payload)
+                decoded = decode(encoded)
                 
                 assert payload == decoded, f"Small payload {payload.hex()} round-trip failed"
 
@@ -117,8 +142,8 @@ class TestErrorHandling:
         for unicode_str in unicode_strings:
                 # Convert to bytes first
                 payload = unicode_str.encode('utf-8')
-                encoded = mcbase64x32.encode(payload)
-                decoded = mcbase64x32.decode(encoded)
+                encoded = encode(payload)
+                decoded = decode(encoded)
                 decoded_str = decoded.decode('utf-8')
                 
                 assert unicode_str == decoded_str, f"Unicode string round-trip failed for '{unicode_str}'"
@@ -133,8 +158,8 @@ class TestErrorHandling:
         ]
         
         for data in test_data:
-                encoded = mcbase64x32.encode(data)
-                decoded = mcbase64x32.decode(encoded)
+                encoded = encode(data)
+                decoded = decode(encoded)
                 
                 assert data == decoded, f"Binary data with null bytes round-trip failed for {repr(data)}"
 
@@ -145,7 +170,7 @@ class TestErrorHandling:
         # Encode multiple times
         encodings = []
         for _ in range(10):
-            encoded = mcbase64x32.encode(payload)
+            encoded = encode(payload)
             encodings.append(encoded)
         
         # All encodings should be identical
@@ -154,12 +179,12 @@ class TestErrorHandling:
     def test_decoding_consistency_with_same_input(self):
         """Test that decoding the same encoded string multiple times produces consistent results."""
         payload = b"consistency test payload"
-        encoded = mcbase64x32.encode(payload)
+        encoded = encode(payload)
         
         # Decode multiple times
         decodings = []
         for _ in range(10):
-            decoded = mcbase64x32.decode(encoded)
+            decoded = decode(encoded)
             decodings.append(decoded)
         
         # All decodings should be identical